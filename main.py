@@ -15,18 +15,49 @@ Repository: https://github.com/YOUR_USERNAME/telegrambot-friengineers
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import io
 import logging
+import os
+import re
 import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
+import aiofiles  # Async file writes for streamed downloads
+import aiohttp  # Async HTTP client - concurrent feed downloads
+import aiosqlite  # Async SQLite driver - keeps DB I/O off the event loop
 import feedparser  # For parsing RSS/Atom feeds
-import qrcode  # For generating QR codes
+import httpx  # Streamed Telegram file downloads (already a PTB dependency)
+import qrcode  # For generating QR codes (fallback encoder)
 from PIL import Image  # For image conversion
-from telegram import InputFile, Update  # Telegram bot types
-from telegram.ext import (Application, CommandHandler, ContextTypes,
+from telegram import File, InputFile, Update  # Telegram bot types
+from telegram.ext import (Application, CommandHandler, ContextTypes, Job,
                           MessageHandler, filters)  # Bot handlers
 
+try:
+    import numpy as np  # Pixel buffers for the TurboJPEG path
+    from turbojpeg import TurboJPEG  # libjpeg-turbo binding - SIMD JPEG codec
+    _TURBO_JPEG = TurboJPEG()
+except (ImportError, OSError):  # Optional; OSError if the native lib is absent
+    _TURBO_JPEG = None
+
+try:
+    import qrencode  # libqrencode binding - C encoder, fastest option
+except ImportError:  # Optional
+    qrencode = None
+
+try:
+    import segno  # Fast QR encoder - much quicker than pure-Python qrcode
+except ImportError:  # Optional; fall back to qrcode if not installed
+    segno = None
+
 from config import API_TOKEN  # Bot token from .env file
 
 
@@ -40,9 +71,6 @@ DATA_DIR = BASE_DIR / "data"  # Main data directory
 FILES_DIR = DATA_DIR / "files"  # User files storage
 DB_PATH = DATA_DIR / "bot.db"  # SQLite database path
 
-# DateTime format for reminders (YYYY-MM-DD HH:MM)
-DATETIME_FMT = "%Y-%m-%d %H:%M"
-
 
 # ===========================
 # DATABASE & STORAGE SETUP
@@ -59,29 +87,95 @@ def init_dirs() -> None:
     FILES_DIR.mkdir(exist_ok=True)
 
 
-def get_db() -> sqlite3.Connection:
-    """Get SQLite database connection with Row factory.
-    
+# Namedtuple row classes keyed by a query's column names. sqlite3.Row
+# rescans the column list on every ["name"] lookup; a namedtuple binds
+# columns when the class is built, so row.name is a plain attribute read.
+# One class per distinct SELECT shape, built on first use.
+_ROW_CLASSES: dict[tuple[str, ...], type] = {}
+
+
+def _row_factory(cursor: sqlite3.Cursor, row: tuple) -> tuple:
+    """Build rows as namedtuples with per-query class caching.
+
+    Args:
+        cursor: Cursor the row came from (supplies column names).
+        row: Raw value tuple from SQLite.
+
+    Returns:
+        tuple: Namedtuple exposing the row's columns as attributes.
+    """
+    fields = tuple(d[0] for d in cursor.description)
+    cls = _ROW_CLASSES.get(fields)
+    if cls is None:
+        cls = _ROW_CLASSES[fields] = namedtuple("Row", fields, rename=True)
+    return cls._make(row)
+
+
+# Singleton database connection - opening a fresh connection per call
+# throws away SQLite's page cache and prepared statements every time.
+_CONN: aiosqlite.Connection | None = None
+_DB_LOCK = asyncio.Lock()  # Serialize access to the shared connection
+
+
+async def _get_conn() -> aiosqlite.Connection:
+    """Get (or lazily open) the shared SQLite connection.
+
     Returns:
-        sqlite3.Connection: Database connection with row_factory set
-                           to access columns by name.
+        aiosqlite.Connection: Module-level connection with row_factory set
+                             to return namedtuple rows.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = await aiosqlite.connect(DB_PATH)
+        _CONN.row_factory = _row_factory  # Namedtuple rows - see _row_factory
+        # WAL lets readers run alongside a writer and NORMAL halves the
+        # fsync count per write; both are safe for this single-process bot
+        await _CONN.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-8000;
+            PRAGMA mmap_size=67108864;
+            """
+        )
+    return _CONN
+
+
+@asynccontextmanager
+async def get_db() -> AsyncIterator[aiosqlite.Connection]:
+    """Get the shared SQLite database connection.
+
+    The connection is opened once and reused for the lifetime of the
+    process, keeping SQLite's page cache and statement cache hot instead
+    of rebuilding them on every command. aiosqlite runs queries on its
+    own worker thread, so awaiting them never blocks the event loop.
+
+    Yields:
+        aiosqlite.Connection: Shared connection; commits on successful exit.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Allow dict-like access to rows
-    return conn
+    conn = await _get_conn()
+    async with _DB_LOCK:
+        try:
+            yield conn
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """Initialize database tables if they don't exist.
-    
+
     Creates four tables:
     - users: Store user information (id, username, names)
     - feeds: User's RSS feed subscriptions
     - tasks: Todo tasks with completion status
     - reminders: Scheduled reminders with UTC timestamps
     """
-    with get_db() as conn:
-        conn.executescript(
+    async with get_db() as conn:
+        await conn.executescript(
             """
             -- User information table
             CREATE TABLE IF NOT EXISTS users (
@@ -90,34 +184,62 @@ def init_db() -> None:
                 first_name TEXT,                   -- User's first name
                 last_name TEXT,                    -- User's last name
                 created_at TEXT                    -- Account creation timestamp
-            );
+            ) STRICT;
 
             -- RSS feed subscriptions
             CREATE TABLE IF NOT EXISTS feeds (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Feed ID
+                id INTEGER PRIMARY KEY,                -- Feed ID (rowid alias)
                 user_id INTEGER NOT NULL,              -- Owner's Telegram ID
                 url TEXT NOT NULL,                     -- RSS feed URL
                 title TEXT,                            -- Feed title
                 created_at TEXT                        -- Subscription timestamp
-            );
+            ) STRICT;
 
             -- Task/Todo list
             CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Task ID
+                id INTEGER PRIMARY KEY,                -- Task ID (rowid alias)
                 user_id INTEGER NOT NULL,              -- Owner's Telegram ID
                 text TEXT NOT NULL,                    -- Task description
                 is_done INTEGER NOT NULL DEFAULT 0,    -- Completion status (0=pending, 1=done)
                 created_at TEXT                        -- Creation timestamp
-            );
+            ) STRICT;
 
             -- Scheduled reminders
             CREATE TABLE IF NOT EXISTS reminders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Reminder ID
+                id INTEGER PRIMARY KEY,                -- Reminder ID (rowid alias)
                 user_id INTEGER NOT NULL,              -- Owner's Telegram ID
                 remind_at TEXT NOT NULL,               -- When to remind (ISO format, UTC)
                 text TEXT NOT NULL,                    -- Reminder message
                 created_at TEXT                        -- Creation timestamp
-            );
+            ) STRICT;
+
+            -- Index of saved files (mirrors data/files/<user_id>/ contents)
+            CREATE TABLE IF NOT EXISTS files (
+                user_id INTEGER NOT NULL,              -- Owner's Telegram ID
+                name TEXT NOT NULL,                    -- Filename in user's directory
+                size INTEGER,                          -- File size in bytes
+                saved_at TEXT,                         -- Save timestamp
+                PRIMARY KEY (user_id, name)
+            ) STRICT, WITHOUT ROWID;
+
+            -- Conditional-GET cache for feed downloads (shared across users)
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,                  -- Feed URL
+                etag TEXT,                             -- ETag from last 200 response
+                last_modified TEXT,                    -- Last-Modified from last 200 response
+                body BLOB,                             -- Last downloaded feed body
+                fetched_at TEXT                        -- Download timestamp
+            ) STRICT;
+
+            -- Indexes so per-user listing/delete queries seek instead of
+            -- scanning the whole table (and satisfy their ORDER BY for free)
+            CREATE INDEX IF NOT EXISTS idx_feeds_user ON feeds(user_id, id);
+            CREATE INDEX IF NOT EXISTS idx_tasks_user ON tasks(user_id, id);
+            CREATE INDEX IF NOT EXISTS idx_reminders_user_time ON reminders(user_id, remind_at);
+
+            -- Serves the cross-user "remind_at >= now" scan at startup,
+            -- which the per-user composite index above can't satisfy
+            CREATE INDEX IF NOT EXISTS idx_reminders_time ON reminders(remind_at);
             """
         )
 
@@ -135,43 +257,85 @@ def now_utc() ->  dt.datetime:
     return dt.datetime.now(dt.timezone.utc)
 
 
-def upsert_user(update: Update) -> None:
+# Escape table for user-supplied text going into parse_mode="HTML"
+# replies; str.translate applies it in one C-level pass
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def esc(text: str) -> str:
+    """Escape user-supplied text for inclusion in an HTML message.
+
+    Unescaped '<' / '&' in task text, feed titles or filenames would make
+    Telegram reject the whole message as malformed HTML.
+
+    Args:
+        text: Untrusted text (task text, feed title, filename, ...).
+
+    Returns:
+        str: Text safe to interpolate into an HTML-formatted reply.
+    """
+    return str(text).translate(_HTML_ESCAPE)
+
+
+# SQL for upsert_user, hoisted so the connection's statement cache always
+# sees the exact same string and skips re-parsing the query per command
+_SQL_UPSERT_USER = """
+    INSERT OR IGNORE INTO users (id, username, first_name, last_name, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# User IDs already written to the users table this process lifetime -
+# lets upsert_user skip the DB entirely for repeat callers
+_SEEN_USERS: set[int] = set()
+
+
+async def upsert_user(update: Update) -> None:
     """Save or update user information in database.
-    
+
     Uses INSERT OR IGNORE to avoid duplicate entries.
-    Called at the start of every command to track users.
-    
+    Called at the start of every command to track users; after the first
+    command from a user the in-memory guard makes this a set lookup
+    instead of a DB write.
+
     Args:
         update: Telegram Update object containing user info.
     """
     if not update.effective_user:
         return
     user = update.effective_user
+    if user.id in _SEEN_USERS:  # Already stored - skip the DB round-trip
+        return
     created_at = now_utc().isoformat()
-    with get_db() as conn:
-        conn.execute(
-            """
-            INSERT OR IGNORE INTO users (id, username, first_name, last_name, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+    async with get_db() as conn:
+        await conn.execute(
+            _SQL_UPSERT_USER,
             (user.id, user.username, user.first_name, user.last_name, created_at),
         )
+    _SEEN_USERS.add(user.id)  # Only after the commit succeeded
+
+
+# User IDs whose file directory is known to exist - saves the mkdir
+# syscall (which returns EEXIST anyway) on every file command
+_DIR_CACHE: set[int] = set()
 
 
 def ensure_user_dir(user_id: int) -> Path:
     """Create and return user-specific file storage directory.
-    
+
     Each user gets their own subdirectory in data/files/
-    to keep their uploaded files separate.
-    
+    to keep their uploaded files separate. The directory is only
+    created on the first call per user; afterwards this is a set lookup.
+
     Args:
         user_id: Telegram user ID.
-    
+
     Returns:
         Path: Path to user's file directory.
     """
     user_dir = FILES_DIR / str(user_id)
-    user_dir.mkdir(parents=True, exist_ok=True)  # Create if doesn't exist
+    if user_id not in _DIR_CACHE:
+        user_dir.mkdir(parents=True, exist_ok=True)  # Create if doesn't exist
+        _DIR_CACHE.add(user_id)
     return user_dir
 
 
@@ -179,38 +343,90 @@ def ensure_user_dir(user_id: int) -> Path:
 # HELP & WELCOME MESSAGES
 # ===========================
 
+# Help text is static - build it once at import instead of
+# re-concatenating ~20 string fragments on every /start and /help
+_HELP_TEXT = (
+    "📚 <b>Available Commands</b>\n\n"
+    "🏠 <b>General</b>\n"
+    "/start - Welcome message\n"
+    "/help - Show this help\n\n"
+    "📰 <b>RSS / Feeds</b>\n"
+    "/rss_add &lt;url&gt; - Subscribe to RSS feed\n"
+    "/rss_list - Show your feeds\n"
+    "/rss_remove &lt;id|url&gt; - Unsubscribe\n"
+    "/rss_latest - Get latest entries\n\n"
+    "✅ <b>Tasks & Reminders</b>\n"
+    "/task_add &lt;text&gt; - Create new task\n"
+    "/task_list - Show all tasks\n"
+    "/task_done &lt;id&gt; - Mark task complete\n"
+    "/remind_add &lt;YYYY-MM-DD HH:MM&gt; &lt;text&gt; - Set reminder (UTC)\n"
+    "/remind_list - Show reminders\n"
+    "/remind_cancel &lt;id&gt; - Cancel reminder\n\n"
+    "📁 <b>Files & Converter</b>\n"
+    "📤 Send any file or photo to save it\n"
+    "/files_list - View saved files\n"
+    "/files_get &lt;name&gt; - Download file\n"
+    "/convert_png - Convert last image to PNG\n"
+    "/convert_jpg - Convert last image to JPG\n\n"
+    "🔧 <b>Utilities</b>\n"
+    "/qr &lt;text or url&gt; - Generate QR code\n"
+)
+
+
+# Static body of the /start welcome message; only the greeting line
+# varies per user, so the rest is concatenated once at import
+_WELCOME_TEXT = (
+    "I'm your multi-purpose assistant bot. "
+    "I can help you with RSS feeds, tasks, reminders, file management, and more!\n\n"
+    + _HELP_TEXT
+)
+
+
+# Usage replies are fixed strings - built once at import instead of
+# re-concatenating their fragments on every mistyped command
+_USAGE = {
+    "rss_add": (
+        "❌ <b>Usage:</b> <code>/rss_add &lt;url&gt;</code>\n\n"
+        "<b>Example:</b> <code>/rss_add https://example.com/feed.xml</code>"
+    ),
+    "rss_remove": (
+        "❌ <b>Usage:</b> <code>/rss_remove &lt;id|url&gt;</code>\n\n"
+        "<b>Example:</b> <code>/rss_remove 1</code>"
+    ),
+    "task_add": (
+        "❌ <b>Usage:</b> <code>/task_add &lt;text&gt;</code>\n\n"
+        "<b>Example:</b> <code>/task_add Buy groceries</code>"
+    ),
+    "task_done": (
+        "❌ <b>Usage:</b> <code>/task_done &lt;id&gt;</code>\n\n"
+        "<b>Example:</b> <code>/task_done 1</code>"
+    ),
+    "remind_add": (
+        "❌ <b>Usage:</b> <code>/remind_add &lt;YYYY-MM-DD HH:MM&gt; &lt;text&gt;</code> (UTC)\n\n"
+        "<b>Example:</b> <code>/remind_add 2026-02-15 14:30 Meeting with team</code>"
+    ),
+    "remind_cancel": (
+        "❌ <b>Usage:</b> <code>/remind_cancel &lt;id&gt;</code>\n\n"
+        "<b>Example:</b> <code>/remind_cancel 1</code>"
+    ),
+    "files_get": (
+        "❌ <b>Usage:</b> <code>/files_get &lt;name&gt;</code>\n\n"
+        "<b>Example:</b> <code>/files_get photo_123.jpg</code>"
+    ),
+    "qr": (
+        "❌ <b>Usage:</b> <code>/qr &lt;text or url&gt;</code>\n\n"
+        "<b>Example:</b> <code>/qr https://github.com</code>"
+    ),
+}
+
+
 def format_help() -> str:
-    """Generate formatted help message with all available commands.
-    
+    """Get the formatted help message with all available commands.
+
     Returns:
         str: HTML-formatted help text with emojis and command descriptions.
     """
-    return (
-        "📚 <b>Available Commands</b>\n\n"
-        "🏠 <b>General</b>\n"
-        "/start - Welcome message\n"
-        "/help - Show this help\n\n"
-        "📰 <b>RSS / Feeds</b>\n"
-        "/rss_add &lt;url&gt; - Subscribe to RSS feed\n"
-        "/rss_list - Show your feeds\n"
-        "/rss_remove &lt;id|url&gt; - Unsubscribe\n"
-        "/rss_latest - Get latest entries\n\n"
-        "✅ <b>Tasks & Reminders</b>\n"
-        "/task_add &lt;text&gt; - Create new task\n"
-        "/task_list - Show all tasks\n"
-        "/task_done &lt;id&gt; - Mark task complete\n"
-        "/remind_add &lt;YYYY-MM-DD HH:MM&gt; &lt;text&gt; - Set reminder (UTC)\n"
-        "/remind_list - Show reminders\n"
-        "/remind_cancel &lt;id&gt; - Cancel reminder\n\n"
-        "📁 <b>Files & Converter</b>\n"
-        "📤 Send any file or photo to save it\n"
-        "/files_list - View saved files\n"
-        "/files_get &lt;name&gt; - Download file\n"
-        "/convert_png - Convert last image to PNG\n"
-        "/convert_jpg - Convert last image to JPG\n\n"
-        "🔧 <b>Utilities</b>\n"
-        "/qr &lt;text or url&gt; - Generate QR code\n"
-    )
+    return _HELP_TEXT
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -220,14 +436,11 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context with user data.
     """
-    upsert_user(update)  # Save user info to database
+    await upsert_user(update)  # Save user info to database
     user = update.effective_user
     name = user.first_name if user else "there"
     await update.message.reply_text(
-        f"👋 <b>Welcome {name}!</b>\n\n"
-        f"I'm your multi-purpose assistant bot. "
-        f"I can help you with RSS feeds, tasks, reminders, file management, and more!\n\n"
-        f"{format_help()}",
+        f"👋 <b>Welcome {esc(name)}!</b>\n\n{_WELCOME_TEXT}",
         parse_mode="HTML"
     )
 
@@ -249,15 +462,187 @@ def parse_args_text(context: ContextTypes.DEFAULT_TYPE) -> str:
         context: Bot context containing command arguments.
     
     Returns:
-        str: Joined arguments with whitespace stripped.
+        str: Arguments joined with single spaces.
     """
-    return " ".join(context.args).strip()
+    # CommandHandler tokenizes on whitespace, so the parts carry none of
+    # their own - joining them is already stripped
+    return " ".join(context.args)
 
 
 # ===========================
 # RSS FEED COMMANDS
 # ===========================
 
+# Timeout for a single feed download
+FEED_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Recently validated feed titles: url -> (validated_at, title).
+# Lets a repeated /rss_add of the same URL skip the download + parse.
+_TITLE_CACHE: dict[str, tuple[float, str | None]] = {}
+_TITLE_CACHE_TTL = 300  # Seconds a validated title stays fresh
+_TITLE_CACHE_MAX = 256  # Entries kept before evicting the oldest
+_TITLE_PROBE_BYTES = 4096  # Head bytes fetched to validate a feed in /rss_add
+
+# Recently parsed feeds: url -> (parsed_at, feed). Even a 304 roundtrip
+# plus re-parse is wasted work when the same feed was rendered seconds
+# ago; within the TTL, /rss_latest reuses the parsed object outright.
+_FEED_CACHE: dict[str, tuple[float, feedparser.FeedParserDict]] = {}
+_FEED_CACHE_TTL = 300  # Seconds a parsed feed stays fresh
+_FEED_CACHE_MAX = 512  # Entries kept before evicting the oldest
+
+
+async def fetch_feed_body(session: aiohttp.ClientSession, url: str) -> bytes:
+    """Download a feed body without blocking the event loop.
+
+    Sends If-None-Match / If-Modified-Since from the feed_cache table so
+    unchanged feeds come back as a header-only 304 and the cached body is
+    reused instead of being re-downloaded from the network.
+
+    Args:
+        session: Shared aiohttp session (created at startup).
+        url: Feed URL to download.
+
+    Returns:
+        bytes: Raw feed XML (fresh or cached).
+    """
+    # Look up validators from the previous successful download
+    async with get_db() as conn:
+        cur = await conn.execute(
+            "SELECT etag, last_modified, body FROM feed_cache WHERE url = ?",
+            (url,),
+        )
+        cached = await cur.fetchone()
+
+    headers = {}
+    if cached:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    async with session.get(url, timeout=FEED_TIMEOUT, headers=headers) as resp:
+        # 304 Not Modified - server confirmed our cached copy is current
+        if resp.status == 304 and cached:
+            return cached.body
+        # Error responses must fail, not be cached and parsed as a feed
+        # (aiohttp doesn't raise on 4xx/5xx by itself)
+        resp.raise_for_status()
+        body = await resp.read()
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+
+    # Remember the new body and validators for the next fetch
+    async with get_db() as conn:
+        await conn.execute(
+            """
+            INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, body, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (url, etag, last_modified, body, now_utc().isoformat()),
+        )
+    return body
+
+
+async def fetch_feed(session: aiohttp.ClientSession, url: str) -> feedparser.FeedParserDict:
+    """Download and parse an RSS/Atom feed.
+
+    Args:
+        session: Shared aiohttp session (created at startup).
+        url: Feed URL to download.
+
+    Returns:
+        feedparser.FeedParserDict: Parsed feed structure.
+    """
+    cached = _FEED_CACHE.get(url)
+    if cached and time.monotonic() - cached[0] < _FEED_CACHE_TTL:
+        return cached[1]
+
+    body = await fetch_feed_body(session, url)
+    # Parsing bytes - no hidden HTTP call. The XML parse itself is
+    # CPU-bound, so it runs in a thread to keep the event loop free
+    # while several feeds parse back-to-back.
+    parsed = await asyncio.to_thread(feedparser.parse, body)
+
+    if len(_FEED_CACHE) >= _FEED_CACHE_MAX:  # Evict the stalest entry
+        del _FEED_CACHE[min(_FEED_CACHE, key=lambda u: _FEED_CACHE[u][0])]
+    _FEED_CACHE[url] = (time.monotonic(), parsed)
+    return parsed
+
+
+def extract_feed_title(body: bytes) -> str | None:
+    """Pull the feed-level <title> out of raw RSS/Atom XML.
+
+    Streams the document with iterparse and stops at the first <title>
+    element, so validating a feed in /rss_add doesn't pay for the full
+    entry-list parse, URL resolution and HTML sanitizing feedparser does.
+
+    Works on truncated input too: a pull parser keeps the events that
+    arrived before the cut, so the first few KB of a feed are enough as
+    long as the header <title> is inside them.
+
+    Only real feed documents are accepted: the root must be rss/feed/RDF
+    and the title's parent must be channel/feed, so an HTML page with a
+    <title> (or an entry's own title) never passes as a feed.
+
+    Args:
+        body: Raw feed XML, possibly truncated.
+
+    Returns:
+        str | None: Feed title, or None if the document isn't a feed or
+                    has no header title (caller should fall back to
+                    feedparser for the final verdict).
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    try:
+        parser.feed(body)
+    except ET.ParseError:
+        pass  # Truncated/garbled tail - events before it are still queued
+    stack: list[str] = []  # Local tag names of the currently open elements
+    try:
+        for event, elem in parser.read_events():
+            tag = elem.tag.rsplit("}", 1)[-1]  # Strip any XML namespace
+            if event == "start":
+                if not stack and tag not in ("rss", "feed", "RDF"):
+                    return None  # Not a feed document (e.g. an HTML page)
+                stack.append(tag)
+                continue
+            stack.pop()
+            if tag == "title" and stack and stack[-1] in ("channel", "feed"):
+                return elem.text
+            if tag in ("item", "entry"):  # Past the header - no title coming
+                return None
+    except ET.ParseError:
+        return None
+    return None
+
+
+async def probe_feed_title(session: aiohttp.ClientSession, url: str) -> str | None:
+    """Read just enough of a feed to find its header <title>.
+
+    Asks for the first few KB with a Range header (and caps the read even
+    when the server ignores Range), so validating a URL in /rss_add
+    doesn't download a potentially multi-megabyte feed. Deliberately
+    bypasses feed_cache: a partial body must never be stored as if it
+    were the full document.
+
+    Args:
+        session: Shared aiohttp session (created at startup).
+        url: Feed URL to probe.
+
+    Returns:
+        str | None: Feed title, or None if the probe failed for any
+                    reason (caller should fall back to the full fetch).
+    """
+    headers = {"Range": f"bytes=0-{_TITLE_PROBE_BYTES - 1}"}
+    try:
+        async with session.get(url, timeout=FEED_TIMEOUT, headers=headers) as resp:
+            if resp.status not in (200, 206):
+                return None
+            head = await resp.content.read(_TITLE_PROBE_BYTES)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+    return extract_feed_title(head)
+
 
 async def rss_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Subscribe to an RSS/Atom feed.
@@ -269,43 +654,67 @@ async def rss_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context with command arguments.
     """
-    upsert_user(update)
+    await upsert_user(update)
     url = parse_args_text(context)
     
     # Validate URL provided
     if not url:
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/rss_add &lt;url&gt;</code>\n\n"
-            "<b>Example:</b> <code>/rss_add https://example.com/feed.xml</code>",
+            _USAGE["rss_add"],
             parse_mode="HTML"
         )
         return
 
-    # Try to parse the feed
-    feed = feedparser.parse(url)
-    # Check if feed is valid (bozo=True means parsing error, no entries=empty feed)
-    if feed.bozo and not feed.entries:
-        await update.message.reply_text(
-            "⚠️ <b>Feed not valid or unreachable.</b>\n\n"
-            "Please check the URL and try again.",
-            parse_mode="HTML"
-        )
-        return
-
-    # Extract feed title if available
-    title = feed.feed.get("title") if feed.feed else None
+    # Reuse a recently validated title instead of re-downloading the feed
+    cached = _TITLE_CACHE.get(url)
+    if cached and time.monotonic() - cached[0] < _TITLE_CACHE_TTL:
+        title = cached[1]
+    else:
+        session = context.application.bot_data["http"]
+        # Cheapest path: a ranged probe of the first few KB is usually
+        # enough to confirm the feed and read its title
+        title = await probe_feed_title(session, url)
+        if title is None:
+            # Probe failed - download the feed (conditional-GET cached)
+            try:
+                body = await fetch_feed_body(session, url)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                await update.message.reply_text(
+                    "⚠️ <b>Feed not valid or unreachable.</b>\n\n"
+                    "Please check the URL and try again.",
+                    parse_mode="HTML"
+                )
+                return
+
+            # Stream out just the feed-level <title> from the full body
+            title = extract_feed_title(body)
+        if title is None:
+            # Still no title - run the full parse to decide validity
+            # (bozo=True means parsing error, no entries=empty feed)
+            feed = await asyncio.to_thread(feedparser.parse, body)
+            if feed.bozo and not feed.entries:
+                await update.message.reply_text(
+                    "⚠️ <b>Feed not valid or unreachable.</b>\n\n"
+                    "Please check the URL and try again.",
+                    parse_mode="HTML"
+                )
+                return
+            title = feed.feed.get("title") if feed.feed else None
+        if len(_TITLE_CACHE) >= _TITLE_CACHE_MAX:  # Evict the stalest entry
+            del _TITLE_CACHE[min(_TITLE_CACHE, key=lambda u: _TITLE_CACHE[u][0])]
+        _TITLE_CACHE[url] = (time.monotonic(), title)
     created_at = now_utc().isoformat()
     
     # Save feed to database
-    with get_db() as conn:
-        conn.execute(
+    async with get_db() as conn:
+        await conn.execute(
             "INSERT INTO feeds (user_id, url, title, created_at) VALUES (?, ?, ?, ?)",
             (update.effective_user.id, url, title, created_at),
         )
     
     feed_name = title or "Feed"
     await update.message.reply_text(
-        f"✅ <b>Feed added successfully!</b>\n\n📰 {feed_name}",
+        f"✅ <b>Feed added successfully!</b>\n\n📰 {esc(feed_name)}",
         parse_mode="HTML"
     )
 
@@ -319,13 +728,14 @@ async def rss_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context.
     """
-    upsert_user(update)
+    await upsert_user(update)
     # Get all feeds for this user
-    with get_db() as conn:
-        rows = conn.execute(
+    async with get_db() as conn:
+        cur = await conn.execute(
             "SELECT id, url, title FROM feeds WHERE user_id = ? ORDER BY id",
             (update.effective_user.id,),
-        ).fetchall()
+        )
+        rows = await cur.fetchall()
     
     # Check if user has any feeds
     if not rows:
@@ -336,12 +746,11 @@ async def rss_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
     
-    # Build feed list message
-    lines = ["📰 <b>Your RSS Feeds:</b>\n"]
-    for row in rows:
-        label = row["title"] or row["url"]  # Use title if available, otherwise URL
-        lines.append(f"<code>{row['id']}</code>. {label}")
-    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+    # Build feed list message in one pass (title if available, otherwise URL)
+    body = "\n".join(
+        f"<code>{row.id}</code>. {esc(row.title or row.url)}" for row in rows
+    )
+    await update.message.reply_text("📰 <b>Your RSS Feeds:</b>\n\n" + body, parse_mode="HTML")
 
 
 async def rss_remove(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -354,25 +763,24 @@ async def rss_remove(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         update: Telegram Update object.
         context: Bot context with command arguments.
     """
-    upsert_user(update)
+    await upsert_user(update)
     target = parse_args_text(context)
     if not target:
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/rss_remove &lt;id|url&gt;</code>\n\n"
-            "<b>Example:</b> <code>/rss_remove 1</code>",
+            _USAGE["rss_remove"],
             parse_mode="HTML"
         )
         return
 
     # Delete feed by ID (number) or URL (string)
-    with get_db() as conn:
+    async with get_db() as conn:
         if target.isdigit():  # If target is a number, treat as feed ID
-            result = conn.execute(
+            result = await conn.execute(
                 "DELETE FROM feeds WHERE user_id = ? AND id = ?",
                 (update.effective_user.id, int(target)),
             )
         else:  # Otherwise treat as URL
-            result = conn.execute(
+            result = await conn.execute(
                 "DELETE FROM feeds WHERE user_id = ? AND url = ?",
                 (update.effective_user.id, target),
             )
@@ -394,14 +802,15 @@ async def rss_latest(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         update: Telegram Update object.
         context: Bot context.
     """
-    upsert_user(update)
+    await upsert_user(update)
     
     # Get all user's feeds
-    with get_db() as conn:
-        rows = conn.execute(
+    async with get_db() as conn:
+        cur = await conn.execute(
             "SELECT url, title FROM feeds WHERE user_id = ? ORDER BY id",
             (update.effective_user.id,),
-        ).fetchall()
+        )
+        rows = await cur.fetchall()
     if not rows:
         await update.message.reply_text(
             "📭 <b>No feeds yet.</b>\n\n"
@@ -412,26 +821,40 @@ async def rss_latest(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 
     # Show loading message
     await update.message.reply_text("⏳ <b>Fetching latest entries...</b>", parse_mode="HTML")
-    
-    # Build message with entries from each feed
-    chunks: list[str] = ["📰 <b>Latest Feed Entries:</b>\n"]
-    for row in rows:
-        feed = feedparser.parse(row["url"])  # Parse RSS feed
-        title = row["title"] or feed.feed.get("title") or row["url"]
+
+    # Download all feeds concurrently - total wait is the slowest feed,
+    # not the sum of every round-trip
+    session = context.application.bot_data["http"]
+    results = await asyncio.gather(
+        *(fetch_feed(session, row.url) for row in rows),
+        return_exceptions=True,
+    )
+
+    # Build message with entries from each feed. A single StringIO buffer
+    # grows in C instead of collecting thousands of list fragments that
+    # str.join would have to walk twice.
+    buf = io.StringIO()
+    buf.write("📰 <b>Latest Feed Entries:</b>\n")
+    for row, feed in zip(rows, results):
+        if isinstance(feed, BaseException):  # Download or parse failed
+            buf.write(f"\n\n<b>{esc(row.title or row.url)}</b>")
+            buf.write("\n• <i>(feed unreachable)</i>")
+            continue
+        title = row.title or feed.feed.get("title") or row.url
         entries = feed.entries[:3]  # Get only first 3 entries
-        chunks.append(f"\n<b>{title}</b>")
+        buf.write(f"\n\n<b>{esc(title)}</b>")
         if not entries:
-            chunks.append("• <i>(no entries)</i>")
+            buf.write("\n• <i>(no entries)</i>")
             continue
         # Add each entry with title and link
         for entry in entries:
             entry_title = entry.get("title") or "(no title)"
             entry_link = entry.get("link") or ""
-            chunks.append(f"• {entry_title}")
+            buf.write(f"\n• {esc(entry_title)}")
             if entry_link:
-                chunks.append(f"  {entry_link}")
+                buf.write(f"\n  {esc(entry_link)}")
 
-    await update.message.reply_text("\n".join(chunks), parse_mode="HTML")
+    await update.message.reply_text(buf.getvalue(), parse_mode="HTML")
 
 
 # ===========================
@@ -448,27 +871,26 @@ async def task_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context with task text.
     """
-    upsert_user(update)
+    await upsert_user(update)
     text = parse_args_text(context)
     
     # Validate task text provided
     if not text:
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/task_add &lt;text&gt;</code>\n\n"
-            "<b>Example:</b> <code>/task_add Buy groceries</code>",
+            _USAGE["task_add"],
             parse_mode="HTML"
         )
         return
     
     # Save task to database
     created_at = now_utc().isoformat()
-    with get_db() as conn:
-        conn.execute(
+    async with get_db() as conn:
+        await conn.execute(
             "INSERT INTO tasks (user_id, text, created_at) VALUES (?, ?, ?)",
             (update.effective_user.id, text, created_at),
         )
     await update.message.reply_text(
-        f"✅ <b>Task added!</b>\n\n📝 {text}",
+        f"✅ <b>Task added!</b>\n\n📝 {esc(text)}",
         parse_mode="HTML"
     )
 
@@ -483,14 +905,15 @@ async def task_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context.
     """
-    upsert_user(update)
+    await upsert_user(update)
     
     # Get all user's tasks
-    with get_db() as conn:
-        rows = conn.execute(
+    async with get_db() as conn:
+        cur = await conn.execute(
             "SELECT id, text, is_done FROM tasks WHERE user_id = ? ORDER BY id",
             (update.effective_user.id,),
-        ).fetchall()
+        )
+        rows = await cur.fetchall()
     if not rows:
         await update.message.reply_text(
             "📋 <b>No tasks yet.</b>\n\n"
@@ -499,12 +922,12 @@ async def task_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
     
-    # Build task list with status indicators
-    lines = ["📋 <b>Your Tasks:</b>\n"]
-    for row in rows:
-        status = "✅" if row["is_done"] else "⬜"  # Checkbox visual
-        lines.append(f"{status} <code>{row['id']}</code>. {row['text']}")
-    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+    # Build task list with status indicators (✅ done, ⬜ pending) in one pass
+    body = "\n".join(
+        f"{'✅' if row.is_done else '⬜'} <code>{row.id}</code>. {esc(row.text)}"
+        for row in rows
+    )
+    await update.message.reply_text("📋 <b>Your Tasks:</b>\n\n" + body, parse_mode="HTML")
 
 
 async def task_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -517,21 +940,20 @@ async def task_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context with task ID.
     """
-    upsert_user(update)
+    await upsert_user(update)
     target = parse_args_text(context)
     
     # Validate task ID provided
     if not target or not target.isdigit():
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/task_done &lt;id&gt;</code>\n\n"
-            "<b>Example:</b> <code>/task_done 1</code>",
+            _USAGE["task_done"],
             parse_mode="HTML"
         )
         return
     
     # Update task status to done (is_done = 1)
-    with get_db() as conn:
-        result = conn.execute(
+    async with get_db() as conn:
+        result = await conn.execute(
             "UPDATE tasks SET is_done = 1 WHERE user_id = ? AND id = ?",
             (update.effective_user.id, int(target)),
         )
@@ -545,22 +967,39 @@ async def task_done(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 # REMINDER SYSTEM COMMANDS
 # ===========================
 
+# Shape check for reminder timestamps (YYYY-MM-DD HH:MM), compiled once
+_REMIND_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+
+
 def parse_remind_time(raw: str) -> dt.datetime | None:
     """Parse datetime string into UTC datetime object.
-    
+
+    The shape is validated with one precompiled regex, then the value
+    goes through datetime.fromisoformat - a C fast path in CPython 3.11+
+    that beats strptime by an order of magnitude and replaces the
+    hand-sliced field parsing used before.
+
     Args:
         raw: Datetime string in format "YYYY-MM-DD HH:MM"
-    
+
     Returns:
         dt.datetime | None: Parsed datetime in UTC, or None if invalid format.
     """
+    if not _REMIND_RE.fullmatch(raw):
+        return None
     try:
-        parsed = dt.datetime.strptime(raw, DATETIME_FMT)
-    except ValueError:
+        parsed = dt.datetime.fromisoformat(raw)
+    except ValueError:  # Shape matched but values out of range (month 13 etc.)
         return None
     return parsed.replace(tzinfo=dt.timezone.utc)
 
 
+# Live reminder jobs keyed by reminder ID. get_jobs_by_name scans every
+# scheduled job, so /remind_cancel would get slower with each pending
+# reminder; this map makes the lookup O(1).
+_JOBS_BY_ID: dict[int, Job] = {}
+
+
 def schedule_reminder(
     app: Application,
     reminder_id: int,
@@ -581,7 +1020,7 @@ def schedule_reminder(
     delay = max(0, (remind_at - now_utc()).total_seconds())
     
     # Schedule job in Telegram's job queue
-    app.job_queue.run_once(
+    _JOBS_BY_ID[reminder_id] = app.job_queue.run_once(
         reminder_job,  # Function to call
         delay,  # Seconds to wait
         name=f"reminder_{reminder_id}",  # Job name for later reference
@@ -601,17 +1040,18 @@ async def reminder_job(context: ContextTypes.DEFAULT_TYPE) -> None:
     user_id = data["user_id"]
     text = data["text"]
     reminder_id = data["reminder_id"]
-    
+    _JOBS_BY_ID.pop(reminder_id, None)  # Job is firing - drop it from the map
+
     # Send reminder message to user
     await context.bot.send_message(
         chat_id=user_id,
-        text=f"⏰ <b>REMINDER!</b>\n\n{text}",
+        text=f"⏰ <b>REMINDER!</b>\n\n{esc(text)}",
         parse_mode="HTML"
     )
     
     # Delete reminder from database after sending
-    with get_db() as conn:
-        conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+    async with get_db() as conn:
+        await conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
 
 
 async def remind_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -625,12 +1065,11 @@ async def remind_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         update: Telegram Update object.
         context: Bot context with datetime and reminder text.
     """
-    upsert_user(update)
+    await upsert_user(update)
     # Need at least date, time, and message text
     if len(context.args) < 2:
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/remind_add &lt;YYYY-MM-DD HH:MM&gt; &lt;text&gt;</code> (UTC)\n\n"
-            "<b>Example:</b> <code>/remind_add 2026-02-15 14:30 Meeting with team</code>",
+            _USAGE["remind_add"],
             parse_mode="HTML"
         )
         return
@@ -660,8 +1099,8 @@ async def remind_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     
     # Save reminder to database
     created_at = now_utc().isoformat()
-    with get_db() as conn:
-        cur = conn.execute(
+    async with get_db() as conn:
+        cur = await conn.execute(
             "INSERT INTO reminders (user_id, remind_at, text, created_at) VALUES (?, ?, ?, ?)",
             (update.effective_user.id, remind_at.isoformat(), text, created_at),
         )
@@ -672,7 +1111,7 @@ async def remind_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     await update.message.reply_text(
         f"⏰ <b>Reminder set!</b>\n\n"
         f"📅 <code>{when_raw}</code> UTC\n"
-        f"📝 {text}",
+        f"📝 {esc(text)}",
         parse_mode="HTML"
     )
 
@@ -687,14 +1126,15 @@ async def remind_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         update: Telegram Update object.
         context: Bot context.
     """
-    upsert_user(update)
+    await upsert_user(update)
     
     # Get all user's reminders sorted by time
-    with get_db() as conn:
-        rows = conn.execute(
+    async with get_db() as conn:
+        cur = await conn.execute(
             "SELECT id, remind_at, text FROM reminders WHERE user_id = ? ORDER BY remind_at",
             (update.effective_user.id,),
-        ).fetchall()
+        )
+        rows = await cur.fetchall()
     if not rows:
         await update.message.reply_text(
             "⏰ <b>No reminders scheduled.</b>\n\n"
@@ -702,10 +1142,11 @@ async def remind_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             parse_mode="HTML"
         )
         return
-    lines = ["⏰ <b>Your Reminders</b> (UTC):\n"]
-    for row in rows:
-        lines.append(f"<code>{row['id']}</code>. 📅 <code>{row['remind_at']}</code> - {row['text']}")
-    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+    body = "\n".join(
+        f"<code>{row.id}</code>. 📅 <code>{row.remind_at}</code> - {esc(row.text)}"
+        for row in rows
+    )
+    await update.message.reply_text("⏰ <b>Your Reminders</b> (UTC):\n\n" + body, parse_mode="HTML")
 
 
 async def remind_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -718,27 +1159,27 @@ async def remind_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         update: Telegram Update object.
         context: Bot context with reminder ID.
     """
-    upsert_user(update)
+    await upsert_user(update)
     target = parse_args_text(context)
     if not target or not target.isdigit():
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/remind_cancel &lt;id&gt;</code>\n\n"
-            "<b>Example:</b> <code>/remind_cancel 1</code>",
+            _USAGE["remind_cancel"],
             parse_mode="HTML"
         )
         return
     reminder_id = int(target)
     
     # Delete reminder from database
-    with get_db() as conn:
-        result = conn.execute(
+    async with get_db() as conn:
+        result = await conn.execute(
             "DELETE FROM reminders WHERE user_id = ? AND id = ?",
             (update.effective_user.id, reminder_id),
         )
     
-    # Cancel the scheduled job if it exists
-    jobs = context.application.job_queue.get_jobs_by_name(f"reminder_{reminder_id}")
-    for job in jobs:
+    # Cancel the scheduled job if it exists (O(1) map lookup instead of
+    # get_jobs_by_name's scan over every scheduled job)
+    job = _JOBS_BY_ID.pop(reminder_id, None)
+    if job:
         job.schedule_removal()  # Remove from job queue
     if result.rowcount:
         await update.message.reply_text("✅ <b>Reminder canceled!</b>", parse_mode="HTML")
@@ -750,6 +1191,47 @@ async def remind_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 # FILE MANAGEMENT COMMANDS
 # ===========================
 
+async def index_file(user_id: int, path: Path) -> None:
+    """Record a saved file in the files table.
+
+    The index lets /files_list answer from one SELECT instead of
+    re-scanning the user's directory on every call.
+
+    Args:
+        user_id: Telegram user ID owning the file.
+        path: Path of the file that was just written.
+    """
+    async with get_db() as conn:
+        await conn.execute(
+            "INSERT OR REPLACE INTO files (user_id, name, size, saved_at) VALUES (?, ?, ?, ?)",
+            (user_id, path.name, path.stat().st_size, now_utc().isoformat()),
+        )
+
+
+async def download_file(file: File, dest: Path) -> None:
+    """Stream a Telegram file straight to disk.
+
+    download_to_drive pulls the whole payload into memory before writing
+    it out, doubling peak RSS for big documents. Streaming 64 KiB chunks
+    from the file URL through aiofiles keeps memory flat and overlaps
+    network receive with the disk write.
+
+    Args:
+        file: Telegram File object from get_file().
+        dest: Destination path in the user's directory.
+    """
+    if not file.file_path or not file.file_path.startswith("http"):
+        # No direct URL (e.g. local bot API server) - use PTB's download
+        await file.download_to_drive(dest)
+        return
+    async with httpx.AsyncClient() as client:
+        async with client.stream("GET", file.file_path) as resp:
+            resp.raise_for_status()
+            async with aiofiles.open(dest, "wb") as out:
+                async for chunk in resp.aiter_bytes(65536):
+                    await out.write(chunk)
+
+
 async def handle_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle incoming files and photos - save to user's directory.
     
@@ -760,7 +1242,7 @@ async def handle_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         update: Telegram Update object with file/photo.
         context: Bot context for storing file path.
     """
-    upsert_user(update)
+    await upsert_user(update)
     user_id = update.effective_user.id
     user_dir = ensure_user_dir(user_id)  # Get/create user's directory
     saved_path: Path | None = None
@@ -771,21 +1253,22 @@ async def handle_file(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         file = await doc.get_file()
         safe_name = doc.file_name or f"file_{doc.file_unique_id}"  # Use original name or generate one
         saved_path = user_dir / safe_name
-        await file.download_to_drive(saved_path)  # Download file from Telegram servers
+        await download_file(file, saved_path)  # Stream from Telegram servers to disk
 
     # Handle photo
     elif update.message.photo:
         photo = update.message.photo[-1]  # Get highest resolution version
         file = await photo.get_file()
         saved_path = user_dir / f"photo_{photo.file_unique_id}.jpg"
-        await file.download_to_drive(saved_path)
+        await download_file(file, saved_path)
 
     if saved_path:
+        await index_file(user_id, saved_path)  # Keep the file index current
         # Store file path in user context for convert commands
         context.user_data["last_file"] = str(saved_path)
         await update.message.reply_text(
             f"✅ <b>File saved!</b>\n\n"
-            f"📁 <code>{saved_path.name}</code>\n\n"
+            f"📁 <code>{esc(saved_path.name)}</code>\n\n"
             f"Use <code>/files_list</code> to view all files or <code>/convert_png</code> <code>/convert_jpg</code> to convert images.",
             parse_mode="HTML"
         )
@@ -801,10 +1284,29 @@ async def files_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         update: Telegram Update object.
         context: Bot context.
     """
-    upsert_user(update)
-    user_dir = ensure_user_dir(update.effective_user.id)
-    # Get all files in user's directory (excluding subdirectories)
-    files = [p.name for p in user_dir.iterdir() if p.is_file()]
+    await upsert_user(update)
+    user_id = update.effective_user.id
+
+    # Serve the listing from the file index - one SELECT from the page
+    # cache instead of a directory scan per call
+    async with get_db() as conn:
+        cur = await conn.execute(
+            "SELECT name FROM files WHERE user_id = ? ORDER BY saved_at DESC, name",
+            (user_id,),
+        )
+        rows = await cur.fetchall()
+    files = [row.name for row in rows]
+
+    if not files:
+        # The directory may predate the index - scan it once and backfill.
+        # scandir's DirEntry answers is_file() from the directory read
+        # itself, avoiding an extra stat() syscall per entry.
+        user_dir = ensure_user_dir(user_id)
+        with os.scandir(user_dir) as it:
+            files = [entry.name for entry in it if entry.is_file()]
+        for name in files:
+            await index_file(user_id, user_dir / name)
+
     if not files:
         await update.message.reply_text(
             "📁 <b>No files saved yet.</b>\n\n"
@@ -812,10 +1314,10 @@ async def files_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
             parse_mode="HTML"
         )
         return
-    lines = ["📁 <b>Your Files:</b>\n"]
-    for idx, f in enumerate(files, 1):
-        lines.append(f"<code>{idx}</code>. {f}")
-    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+    body = "\n".join(
+        f"<code>{idx}</code>. {esc(name)}" for idx, name in enumerate(files, 1)
+    )
+    await update.message.reply_text("📁 <b>Your Files:</b>\n\n" + body, parse_mode="HTML")
 
 
 async def files_get(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -828,19 +1330,19 @@ async def files_get(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context with filename.
     """
-    upsert_user(update)
+    await upsert_user(update)
     name = parse_args_text(context)
     if not name:
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/files_get &lt;name&gt;</code>\n\n"
-            "<b>Example:</b> <code>/files_get photo_123.jpg</code>",
+            _USAGE["files_get"],
             parse_mode="HTML"
         )
         return
     user_dir = ensure_user_dir(update.effective_user.id)
     target = user_dir / name  # Build full file path
-    
-    # Check if file exists
+
+    # The disk is authoritative here: the index can go stale if files
+    # are pruned manually, and reply_document needs the real file anyway
     if not target.exists():
         await update.message.reply_text(
             "❌ <b>File not found.</b>\n\n"
@@ -849,25 +1351,76 @@ async def files_get(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
     
-    # Send file to user
+    # Send file to user - passing the Path lets PTB stream the upload in
+    # chunks instead of reading the whole file into memory first
     await update.message.reply_text("📤 <b>Sending file...</b>", parse_mode="HTML")
-    await update.message.reply_document(document=InputFile(target))
+    await update.message.reply_document(document=target)
 
 
 # ===========================
 # IMAGE CONVERSION COMMANDS
 # ===========================
 
+# Supported image extensions - built once instead of allocating a fresh
+# set literal on every is_image call
+_IMAGE_EXTS = frozenset((".png", ".jpg", ".jpeg", ".webp", ".bmp"))
+
+
 def is_image(path: Path) -> bool:
     """Check if file is a supported image format.
-    
+
     Args:
         path: File path to check.
-    
+
     Returns:
         bool: True if file extension is a supported image format.
     """
-    return path.suffix.lower() in {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+    return path.suffix.lower() in _IMAGE_EXTS
+
+
+# Worker pool for CPU-bound image conversion. Pillow holds the GIL for
+# most of a decode/encode, so processes (not threads) are needed to keep
+# the event loop responsive and use more than one core.
+_IMAGE_POOL = ProcessPoolExecutor(max_workers=4)
+
+
+def _convert_file(src: str, dst: str, fmt: str) -> None:
+    """Convert an image file to another format.
+
+    JPEG output goes through libjpeg-turbo when PyTurboJPEG is installed
+    (SIMD Huffman/DCT, several times faster than Pillow's encoder);
+    otherwise everything runs through Pillow. Runs inside a worker
+    process, so it must stay a top-level function (picklable) and take
+    plain-string paths.
+
+    Args:
+        src: Source image path.
+        dst: Destination image path.
+        fmt: Pillow format name ('PNG' or 'JPEG').
+    """
+    if fmt == "JPEG" and _TURBO_JPEG is not None:
+        if src.lower().endswith((".jpg", ".jpeg")):
+            # JPEG in, JPEG out - decode and encode fully in libjpeg-turbo
+            with open(src, "rb") as f:
+                pixels = _TURBO_JPEG.decode(f.read())  # BGR ndarray
+        else:
+            with Image.open(src) as img:
+                # Copy into C-contiguous BGR - TurboJPEG reads the raw
+                # buffer and would mangle a negative-stride view
+                pixels = np.ascontiguousarray(np.asarray(img.convert("RGB"))[:, :, ::-1])
+        with open(dst, "wb") as f:
+            f.write(_TURBO_JPEG.encode(pixels, quality=90))
+        return
+
+    with Image.open(src) as img:
+        if fmt == "JPEG":
+            img = img.convert("RGB")  # JPEG has no alpha channel
+        elif fmt == "PNG":
+            # Level-1 zlib is a fraction of the encode time of the default
+            # (6) for a small file-size difference on photos
+            img.save(dst, format=fmt, compress_level=1)
+            return
+        img.save(dst, format=fmt)
 
 
 async def convert_image(update: Update, context: ContextTypes.DEFAULT_TYPE, fmt: str) -> None:
@@ -878,7 +1431,7 @@ async def convert_image(update: Update, context: ContextTypes.DEFAULT_TYPE, fmt:
         context: Bot context with last_file reference.
         fmt: Target format ('png' or 'jpg').
     """
-    upsert_user(update)
+    await upsert_user(update)
     # Get last uploaded file path from context
     last_file = context.user_data.get("last_file")
     if not last_file:  # No file uploaded yet
@@ -902,18 +1455,23 @@ async def convert_image(update: Update, context: ContextTypes.DEFAULT_TYPE, fmt:
     # Show conversion progress
     await update.message.reply_text(f"🔄 <b>Converting to {fmt.upper()}...</b>", parse_mode="HTML")
     
-    # Convert image using PIL
+    # Convert image using PIL in a worker process - the event loop keeps
+    # serving other updates while the conversion runs
     out_path = src.with_suffix(f".{fmt}")  # Change file extension
-    with Image.open(src) as img:
-        img.save(out_path, format=fmt.upper())  # Save in new format
-    
+    pil_fmt = "JPEG" if fmt == "jpg" else fmt.upper()  # Pillow's name for .jpg
+    await asyncio.get_running_loop().run_in_executor(
+        _IMAGE_POOL, _convert_file, str(src), str(out_path), pil_fmt
+    )
+
+    await index_file(update.effective_user.id, out_path)  # Converted file is retrievable too
+
     # Update last_file to converted file
     context.user_data["last_file"] = str(out_path)
     await update.message.reply_text(
-        f"✅ <b>Conversion complete!</b>\n\n📄 <code>{out_path.name}</code>",
+        f"✅ <b>Conversion complete!</b>\n\n📄 <code>{esc(out_path.name)}</code>",
         parse_mode="HTML"
     )
-    await update.message.reply_document(document=InputFile(out_path))
+    await update.message.reply_document(document=out_path)  # Streamed by PTB
 
 
 async def convert_png(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -938,6 +1496,40 @@ async def convert_jpg(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 # QR CODE GENERATOR
 # ===========================
 
+def make_qr(text: str) -> bytes:
+    """Render a QR code PNG for the given payload.
+
+    Picks the fastest installed encoder: qrencode (C libqrencode, the
+    Reed-Solomon and matrix layout run in native code), then segno, then
+    pure-Python qrcode as the last resort. Writes into a BytesIO, so no
+    temp file touches the disk.
+
+    Args:
+        text: Text or URL to encode.
+
+    Returns:
+        bytes: PNG image data.
+    """
+    # compress_level=1: a QR bitmap is two-tone, so zlib gains almost
+    # nothing past level 1 and the default level 6 just burns CPU
+    buf = io.BytesIO()
+    if qrencode is not None:
+        # qrencode returns the raw matrix: 1 px per module, no quiet
+        # zone - unscannable as-is. Blow it up to 6 px per module with
+        # nearest-neighbour (keeps modules crisp) and add the standard
+        # 4-module white border.
+        _version, size, img = qrencode.encode(text)
+        img = img.resize((size * 6, size * 6), Image.NEAREST)
+        bordered = Image.new("L", (img.width + 48, img.height + 48), 255)
+        bordered.paste(img, (24, 24))
+        bordered.save(buf, format="PNG", optimize=False, compress_level=1)
+    elif segno is not None:
+        segno.make(text, error="m").save(buf, kind="png", scale=6, compresslevel=1)
+    else:
+        qrcode.make(text).save(buf, format="PNG", optimize=False, compress_level=1)
+    return buf.getvalue()
+
+
 async def qr_code(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Generate QR code from text or URL.
     
@@ -948,12 +1540,11 @@ async def qr_code(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         update: Telegram Update object.
         context: Bot context with text to encode.
     """
-    upsert_user(update)
+    await upsert_user(update)
     text = parse_args_text(context)
     if not text:
         await update.message.reply_text(
-            "❌ <b>Usage:</b> <code>/qr &lt;text or url&gt;</code>\n\n"
-            "<b>Example:</b> <code>/qr https://github.com</code>",
+            _USAGE["qr"],
             parse_mode="HTML"
         )
         return
@@ -961,41 +1552,84 @@ async def qr_code(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Show generation progress
     await update.message.reply_text("🔄 <b>Generating QR code...</b>", parse_mode="HTML")
     
-    # Generate QR code
-    img = qrcode.make(text)  # Create QR code image
-    out_path = DATA_DIR / f"qr_{update.effective_user.id}.png"  # Unique filename per user
-    img.save(out_path)  # Save as PNG
-    
+    # Generate QR code in memory and send it straight from the buffer
+    qr_bytes = make_qr(text)
+
     # Send QR code to user
     await update.message.reply_text("✅ <b>QR code generated!</b>", parse_mode="HTML")
-    await update.message.reply_document(document=InputFile(out_path))
+    await update.message.reply_document(document=InputFile(io.BytesIO(qr_bytes), filename="qr.png"))
 
 
 # ===========================
 # BOT INITIALIZATION
 # ===========================
 
-def schedule_pending_reminders(app: Application) -> None:
+async def schedule_pending_reminders(app: Application) -> None:
     """Re-schedule reminders after bot restart.
-    
+
     Loads all pending reminders from database and schedules them.
     Called during bot initialization to restore scheduled jobs.
-    
+
     Args:
         app: Telegram Application instance.
-    """    
-    # Get all reminders from database
-    with get_db() as conn:
-        rows = conn.execute(
-            "SELECT id, user_id, remind_at, text FROM reminders"
-        ).fetchall()
-    
-    # Schedule each reminder that hasn't passed yet
-    for row in rows:
-        remind_at = dt.datetime.fromisoformat(row["remind_at"])
-        if remind_at < now_utc():  # Skip past reminders
-            continue
-        schedule_reminder(app, row["id"], row["user_id"], row["text"], remind_at)
+    """
+    # One query: SQLite filters out past reminders (ISO strings sort
+    # chronologically), and reminders that expired while the bot was down
+    # are purged in the same transaction instead of lingering forever
+    now_iso = now_utc().isoformat()
+    async with get_db() as conn:
+        cur = await conn.execute(
+            "SELECT id, user_id, remind_at, text FROM reminders "
+            "WHERE remind_at >= ? ORDER BY remind_at",
+            (now_iso,),
+        )
+        rows = await cur.fetchall()
+        await conn.execute("DELETE FROM reminders WHERE remind_at < ?", (now_iso,))
+
+    # Parse every timestamp up front (fromisoformat is a tight C call),
+    # then hand the batch to the job queue without the DB lock held
+    parsed = [
+        (row.id, row.user_id, row.text, dt.datetime.fromisoformat(row.remind_at))
+        for row in rows
+    ]
+    for reminder_id, user_id, text, remind_at in parsed:
+        schedule_reminder(app, reminder_id, user_id, text, remind_at)
+
+
+async def post_init(app: Application) -> None:
+    """Async initialization run by PTB once the event loop is up.
+
+    Creates database tables and restores scheduled reminder jobs -
+    both need the running loop because DB access goes through aiosqlite.
+
+    Args:
+        app: Telegram Application instance.
+    """
+    app.bot_data["http"] = aiohttp.ClientSession()  # Shared HTTP session for feed fetches
+    await init_db()  # Create database tables
+    # Warm the known-user guard in one query so returning users skip the
+    # upsert round-trip from their very first command after a restart
+    async with get_db() as conn:
+        cur = await conn.execute("SELECT id FROM users")
+        _SEEN_USERS.update(row.id for row in await cur.fetchall())
+    await schedule_pending_reminders(app)  # Restore reminders after restart
+
+
+async def post_shutdown(app: Application) -> None:
+    """Close shared resources when the bot stops.
+
+    Args:
+        app: Telegram Application instance.
+    """
+    global _CONN
+    session = app.bot_data.get("http")
+    if session:
+        await session.close()
+    # aiosqlite runs on a non-daemon thread that only stops on close();
+    # leaving the connection open hangs interpreter exit after SIGINT
+    if _CONN:
+        await _CONN.close()
+        _CONN = None
 
 
 def main() -> None:
@@ -1019,12 +1653,23 @@ def main() -> None:
     if not API_TOKEN:
         raise RuntimeError("BOT_TOKEN is missing. Set it in .env or environment variables.")
 
-    # Initialize storage
+    # Initialize storage (DB setup happens in post_init on the event loop)
     init_dirs()  # Create data directories
-    init_db()  # Create database tables
 
     # Build Telegram bot application
-    app = Application.builder().token(API_TOKEN).build()
+    # connection_pool_size: default pool starves when many reminder jobs
+    # fire in the same minute; concurrent_updates lets handlers run in
+    # parallel instead of serially (DB access stays safe behind _DB_LOCK)
+    app = (
+        Application.builder()
+        .token(API_TOKEN)
+        .connection_pool_size(512)
+        .pool_timeout(30.0)
+        .concurrent_updates(True)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     # Register command handlers
     # General commands
@@ -1059,9 +1704,6 @@ def main() -> None:
     # Handle incoming files and photos (non-command messages)
     app.add_handler(MessageHandler(filters.Document.ALL | filters.PHOTO, handle_file))
 
-    # Restore reminders from database after restart
-    schedule_pending_reminders(app)
-    
     # Start bot - polls Telegram servers for updates
     app.run_polling()
 